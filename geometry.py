@@ -12,21 +12,48 @@ Public API
   validate_inputs(D, R_c, r_k, t, h)          → raises ValueError on bad inputs
   compute_derived_geometry(D, R_c, r_k, t, h)  → HeadGeometry dataclass
   build_cross_section(D, R_c, r_k, t, h, ...)  → (r, z) closed profile arrays
+  build_cross_section_path(D, R_c, r_k, t, h, ...) → (xy, codes) for matplotlib Path
 """
 
 from __future__ import annotations
 
+import functools
+import math
+
 import numpy as np
 from dataclasses import dataclass
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional — NumPy paths cover everything
+    _HAVE_NUMBA = False
+
+# Arc sample count above which the numba kernels (when available) beat the
+# vectorized NumPy fill: the scalar loops write straight into the profile
+# buffer with zero temporaries, which wins once memory traffic dominates.
+_NUMBA_MIN_N = 512
+
+# Default profile dtype, sized for plot-only output — float32 halves the
+# memory traffic through the builders and matplotlib rasterizes to float32
+# anyway. Callers feeding metrology or export paths (build_head_mesh with
+# its float64 default) pass dtype=np.float64 through build_cross_section
+# instead. The scalar derived-geometry path stays float64 regardless, to
+# preserve the precision of the tangency-condition square roots.
+_PROFILE_DTYPE = np.float32
+
 
 # ---------------------------------------------------------------------------
 # Dataclass for derived geometric quantities
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeadGeometry:
-    """All derived geometric quantities for a torospherical head."""
+    """All derived geometric quantities for a torospherical head.
+
+    slots=True skips per-instance __dict__ allocation — the class is all
+    scalars and sits on the profile/mesh construction hot path.
+    """
 
     # --- inputs ---
     D: float    # inside diameter
@@ -54,15 +81,29 @@ class HeadGeometry:
 # Input validation
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=32)
 def validate_inputs(D: float, R_c: float, r_k: float, t: float, h: float) -> None:
     """Validate torospherical head parameters.
 
+    Results are memoized — validation is pure, so repeated calls with the
+    same parameter set (every GUI view uses the same module constants)
+    short-circuit to a cache hit.
+
     Raises
     ------
     ValueError
         If any parameter is outside its valid range or violates a geometric
         constraint that would produce imaginary or degenerate geometry.
     """
+    # Fast path: one short-circuiting conjunction for the common all-valid
+    # case. Only on failure do we fall through to the per-condition branch
+    # chain below, which exists solely to format the specific message.
+    half_D = D / 2
+    if D > 0 and t > 0 and r_k > 0 and h >= 0 \
+            and R_c >= half_D and r_k < half_D and t < r_k \
+            and (half_D - r_k) / (R_c - r_k) < 1.0:
+        return
+
     if D <= 0:
         raise ValueError(f"Inside diameter D must be positive (got D={D})")
     if t <= 0:
@@ -92,15 +133,58 @@ def validate_inputs(D: float, R_c: float, r_k: float, t: float, h: float) -> Non
         )
 
 
+def validate_inputs_batch(
+    D, R_c, r_k, t, h
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized validity check over arrays of candidate designs.
+
+    Applies the same constraints as validate_inputs, but as broadcast
+    NumPy comparisons — one pass over a whole parameter sweep instead of
+    one Python call (and one exception) per candidate.
+
+    Parameters
+    ----------
+    D, R_c, r_k, t, h : array_like
+        Candidate parameters; broadcast against each other.
+
+    Returns
+    -------
+    valid : np.ndarray of bool
+        True where the candidate satisfies every constraint.
+    failing : np.ndarray of int
+        Flat indices of the invalid candidates (np.flatnonzero(~valid)).
+    """
+    D, R_c, r_k, t, h = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (D, R_c, r_k, t, h))
+    )
+    half_D = D / 2
+    # The ratio constraint can divide by zero / produce NaN for candidates
+    # that already fail an earlier constraint; NaN compares false against
+    # 1.0, so those rows are flagged invalid either way.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (half_D - r_k) / (R_c - r_k)
+    valid = (
+        (D > 0) & (t > 0) & (r_k > 0) & (h >= 0)
+        & (R_c >= half_D) & (r_k < half_D) & (t < r_k)
+        & (ratio < 1.0)
+    )
+    return valid, np.flatnonzero(~valid)
+
+
 # ---------------------------------------------------------------------------
 # Derived geometry
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=32)
 def compute_derived_geometry(
     D: float, R_c: float, r_k: float, t: float, h: float
 ) -> HeadGeometry:
     """Compute all derived geometric quantities for a torospherical head.
 
+    Results are memoized: HeadGeometry is frozen, so the cached instance is
+    safely shared between the 2D validation view, the segment builder and
+    the 3D mesh builder, which all pass the same parameter set.
+
     Parameters
     ----------
     D    : inside diameter
@@ -125,23 +209,33 @@ def compute_derived_geometry(
     """
     validate_inputs(D, R_c, r_k, t, h)
 
+    # This is a pure-scalar code path — math.* avoids NumPy's ufunc
+    # dispatch / 0-d array boxing overhead on every call.
+
     # Sphere centre z-coordinate.
     # Derived from tangency condition: distance(O_sphere, O_knuckle) = R_c - r_k
-    z_sc = h - np.sqrt((R_c - r_k) ** 2 - (D / 2 - r_k) ** 2)
+    # The square roots below use difference-of-squares factoring
+    # sqrt(a² − b²) = sqrt((a − b)(a + b)): for near-hemispherical heads
+    # (R_c ≈ D/2, the common ASME case) the naive a² − b² subtracts two
+    # nearly equal squares and loses half the mantissa to cancellation.
+    u = R_c - r_k
+    v = D / 2 - r_k
+    z_sc = h - math.sqrt((u - v) * (u + v))
 
     # Shared angular ratio (same for inner and outer surfaces)
-    ratio = (D / 2 - r_k) / (R_c - r_k)
-    alpha = np.arccos(ratio)   # knuckle arc angle from horizontal to tangency
-    phi_t = np.arcsin(ratio)   # crown arc polar angle from apex to tangency
+    ratio = v / u
+    alpha = math.acos(ratio)   # knuckle arc angle from horizontal to tangency
+    phi_t = math.asin(ratio)   # crown arc polar angle from apex to tangency
     # Note: alpha + phi_t = pi/2 (complementary angles, geometrically required)
 
     # Inner tangency point
-    r_t = R_c * (D / 2 - r_k) / (R_c - r_k)
-    z_t = z_sc + np.sqrt(R_c ** 2 - r_t ** 2)
+    r_t = R_c * ratio
+    z_t = z_sc + math.sqrt((R_c - r_t) * (R_c + r_t))
 
     # Outer tangency point
-    r_t_out = (R_c + t) * (D / 2 - r_k) / (R_c - r_k)
-    z_t_out = z_sc + np.sqrt((R_c + t) ** 2 - r_t_out ** 2)
+    R_out = R_c + t
+    r_t_out = R_out * ratio
+    z_t_out = z_sc + math.sqrt((R_out - r_t_out) * (R_out + r_t_out))
 
     # Apex heights (on centreline axis, r = 0)
     z_apex_inner = z_sc + R_c
@@ -158,42 +252,228 @@ def compute_derived_geometry(
     )
 
 
+# ---------------------------------------------------------------------------
+# Optional numba kernels (compiled lazily on first use, cached on disk)
+# ---------------------------------------------------------------------------
+
+if _HAVE_NUMBA:
+    # Both kernels replace the 2n sin/cos calls of direct sampling with an
+    # angle-addition recurrence: only the endpoint and the step need real
+    # transcendentals (2 sin + 2 cos per arc total), the rest follows from
+    #   s_{k+1} = s_k·c_d + c_k·s_d,   c_{k+1} = c_k·c_d - s_k·s_d.
+    # The recurrence drift is O(n·eps) — irrelevant at the n where these
+    # kernels are selected (n >= _NUMBA_MIN_N, mm-scale plot output).
+
+    @njit(cache=True, fastmath=True)
+    def _fill_crown(out_r, out_z, R, z_sc, phi0, phi1):
+        """Crown arc fill: out_r = R·sin(phi), out_z = z_sc + R·cos(phi)."""
+        n = out_r.shape[0]
+        dphi = (phi1 - phi0) / (n - 1)
+        c_d, s_d = math.cos(dphi), math.sin(dphi)
+        c, s = math.cos(phi0), math.sin(phi0)
+        for i in range(n):
+            out_r[i] = R * s
+            out_z[i] = z_sc + R * c
+            c, s = c * c_d - s * s_d, s * c_d + c * s_d
+
+    @njit(cache=True, fastmath=True)
+    def _fill_knuckle(out_r, out_z, r_kc, z_kc, r_k, th0, th1):
+        """Knuckle arc fill: out_r = r_kc + r_k·cos(θ), out_z = z_kc + r_k·sin(θ)."""
+        n = out_r.shape[0]
+        dth = (th1 - th0) / (n - 1)
+        c_d, s_d = math.cos(dth), math.sin(dth)
+        c, s = math.cos(th0), math.sin(th0)
+        for i in range(n):
+            out_r[i] = r_kc + r_k * c
+            out_z[i] = z_kc + r_k * s
+            c, s = c * c_d - s * s_d, s * c_d + c * s_d
+
+
 # ---------------------------------------------------------------------------
 # Private segment samplers
 # ---------------------------------------------------------------------------
 
+def _angles(start: float, end: float, n: int) -> np.ndarray:
+    """Evenly spaced angles from start to end inclusive (linspace equivalent).
+
+    Built as ``start + k*step`` via in-place ops on a single np.arange
+    buffer — one fewer pass over the array than np.linspace, which matters
+    for the memory-bound small-n arc samplers.
+    """
+    ang = np.arange(n, dtype=np.float64)
+    ang *= (end - start) / (n - 1) if n > 1 else 0.0
+    ang += start
+    return ang
+
+
+def _pair(a: float, b: float) -> np.ndarray:
+    """Build a 2-element float array without np.array's dtype-inference path.
+
+    The straight segments are all known 2-point lines; np.array([a, b])
+    spends most of its time inferring a dtype from a fresh Python list.
+    """
+    out = np.empty(2, dtype=_PROFILE_DTYPE)
+    out[0] = a
+    out[1] = b
+    return out
+
+
 def _arc_crown(
-    R: float, z_sc: float, phi_start: float, phi_end: float, n: int
+    R: float, z_sc: float, phi_start: float, phi_end: float, n: int,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Sample n points on a crown (spherical) arc.
 
     phi is the polar angle from the +z axis (apex = 0).
+
+    The (r, z) result is computed into a single (2, n) buffer with in-place
+    ufuncs — on small n the allocator overhead of the naive
+    ``R * np.sin(phi)`` form dominates the actual arithmetic.  Callers that
+    already own a profile buffer can pass a (2, n) view as ``out`` to avoid
+    even that single allocation.
     """
-    phi = np.linspace(phi_start, phi_end, n)
-    return R * np.sin(phi), z_sc + R * np.cos(phi)
+    phi = _angles(phi_start, phi_end, n)
+    if out is None:
+        out = np.empty((2, n), dtype=_PROFILE_DTYPE)
+    np.sin(phi, out=out[0])
+    np.multiply(out[0], R, out=out[0])
+    np.cos(phi, out=out[1])
+    np.multiply(out[1], R, out=out[1])
+    np.add(out[1], z_sc, out=out[1])
+    return out[0], out[1]
 
 
 def _arc_knuckle(
     r_kc: float, z_kc: float, r_k: float,
-    theta_start: float, theta_end: float, n: int
+    theta_start: float, theta_end: float, n: int,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Sample n points on a knuckle (toroidal) arc.
 
     theta is measured from the positive-r axis at the knuckle centre.
     theta = 0  → junction with straight flange (r = r_kc + r_k)
     theta = alpha → tangency point with crown arc
+
+    Same single-buffer, in-place construction (and optional ``out`` view)
+    as _arc_crown.
     """
-    theta = np.linspace(theta_start, theta_end, n)
-    return r_kc + r_k * np.cos(theta), z_kc + r_k * np.sin(theta)
+    theta = _angles(theta_start, theta_end, n)
+    if out is None:
+        out = np.empty((2, n), dtype=_PROFILE_DTYPE)
+    np.cos(theta, out=out[0])
+    np.multiply(out[0], r_k, out=out[0])
+    np.add(out[0], r_kc, out=out[0])
+    np.sin(theta, out=out[1])
+    np.multiply(out[1], r_k, out=out[1])
+    np.add(out[1], z_kc, out=out[1])
+    return out[0], out[1]
 
 
 # ---------------------------------------------------------------------------
 # Cross-section profile builder
 # ---------------------------------------------------------------------------
 
+def _build_profile(
+    g: HeadGeometry, n_arc: int, dtype: np.dtype = _PROFILE_DTYPE,
+) -> np.ndarray:
+    """Fill and return the closed (N, 2) profile buffer (columns r, z).
+
+    Shared backend of build_cross_section and build_cross_section_path —
+    see build_cross_section for the segment map and traversal order.
+    The angular samples are computed in float64 either way; dtype only
+    controls the output buffer the arc values are written into.
+    """
+    D, r_k, t, h = g.D, g.r_k, g.t, g.h
+
+    r_kc = D / 2 - r_k  # knuckle arc centre, radial
+    z_kc = h             # knuckle arc centre, axial
+
+    # The profile size is deterministic: 4 arcs contribute n_arc - 1 points
+    # each (last point deduplicated against the next segment), the 4 straight
+    # segments contribute 1 + 1 + 1 + 2 points, plus 1 closing point.
+    # One (N, 2) buffer is filled in place — no per-segment temporaries,
+    # no np.concatenate, no np.append reallocation-and-copy.
+    N = 4 * n_arc + 2
+    prof = np.empty((N, 2), dtype=dtype)
+
+    # Each arc writes all n_arc points; the shared junction point is then
+    # overwritten by the first point of the following segment, which
+    # reproduces the de-duplication of the old concatenate-based layout.
+
+    if _HAVE_NUMBA and n_arc >= _NUMBA_MIN_N:
+        # Compiled scalar loops: zero temporaries, libm sincos, write
+        # straight into the profile buffer. Only worthwhile at high
+        # resolution — below the threshold JIT dispatch overhead loses
+        # to the vectorized fill.
+        _fill_crown(prof[0:n_arc, 0], prof[0:n_arc, 1],
+                    g.R_c, g.z_sc, 0.0, g.phi_t)
+        _fill_knuckle(prof[n_arc - 1:2 * n_arc - 1, 0],
+                      prof[n_arc - 1:2 * n_arc - 1, 1],
+                      r_kc, z_kc, r_k, g.alpha, 0.0)
+        _fill_knuckle(prof[2 * n_arc + 1:3 * n_arc + 1, 0],
+                      prof[2 * n_arc + 1:3 * n_arc + 1, 1],
+                      r_kc, z_kc, r_k + t, 0.0, g.alpha)
+        _fill_crown(prof[3 * n_arc:4 * n_arc, 0], prof[3 * n_arc:4 * n_arc, 1],
+                    g.R_c + t, g.z_sc, g.phi_t, 0.0)
+    else:
+        # The inner and outer arcs of each family share the same angular
+        # samples (alpha and phi_t are identical for both surfaces — uniform
+        # normal offset, see compute_derived_geometry), so sin/cos is
+        # evaluated once per family and reused for both radii. The inner
+        # arcs run forward, the outer arcs reversed, matching the
+        # counter-clockwise traversal.
+        phi = _angles(0.0, g.phi_t, n_arc)   # crown: apex → tangency
+        sin_p, cos_p = np.sin(phi), np.cos(phi)
+        theta = _angles(0.0, g.alpha, n_arc)  # knuckle: flange → tangency
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+
+        def fill_arc(rows: slice, radius: float, r_off: float, z_off: float,
+                     r_trig: np.ndarray, z_trig: np.ndarray) -> None:
+            """Write (r_off + radius*r_trig, z_off + radius*z_trig) into prof[rows]."""
+            np.multiply(r_trig, radius, out=prof[rows, 0])
+            prof[rows, 0] += r_off
+            np.multiply(z_trig, radius, out=prof[rows, 1])
+            prof[rows, 1] += z_off
+
+        # 1. Inner crown arc: phi 0 → phi_t              rows [0, n_arc)
+        fill_arc(slice(0, n_arc), g.R_c, 0.0, g.z_sc, sin_p, cos_p)
+
+        # 2. Inner knuckle arc: theta alpha → 0          rows [n_arc-1, 2n-1)
+        fill_arc(slice(n_arc - 1, 2 * n_arc - 1), r_k, r_kc, z_kc,
+                 cos_t[::-1], sin_t[::-1])
+
+        # 6. Outer knuckle arc: theta 0 → alpha          rows [2n+1, 3n+1)
+        fill_arc(slice(2 * n_arc + 1, 3 * n_arc + 1), r_k + t, r_kc, z_kc,
+                 cos_t, sin_t)
+
+        # 7. Outer crown arc: phi phi_t → 0              rows [3n, 4n)
+        fill_arc(slice(3 * n_arc, 4 * n_arc), g.R_c + t, 0.0, g.z_sc,
+                 sin_p[::-1], cos_p[::-1])
+
+    # 3. Inner straight flange: z h → 0                  row  2n-2
+    prof[2 * n_arc - 2] = (D / 2, h)
+
+    # 4. Bottom rim: r D/2 → D/2+t                       row  2n-1
+    prof[2 * n_arc - 1] = (D / 2, 0.0)
+
+    # 5. Outer straight flange: z 0 → h                  row  2n
+    prof[2 * n_arc] = (D / 2 + t, 0.0)
+
+    # 8. Apex flat: r=0, z_apex_outer → z_apex_inner     rows 4n-1, 4n
+    prof[4 * n_arc - 1] = (0.0, g.z_apex_outer)
+    prof[4 * n_arc] = (0.0, g.z_apex_inner)
+
+    # Closing point — the buffer was sized with a +1 slot so the loop is
+    # closed in place, with no np.append full-array copy.
+    prof[N - 1] = prof[0]
+
+    return prof
+
+
 def build_cross_section(
     D: float, R_c: float, r_k: float, t: float, h: float,
     n_arc: int = 64,
+    dtype: np.dtype = _PROFILE_DTYPE,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Build the closed 2D cross-section profile of a torospherical head.
 
@@ -208,12 +488,16 @@ def build_cross_section(
     n_arc : int
         Number of sample points per curved arc segment.
         Straight segments always use 2 points.
+    dtype : np.dtype
+        Profile array dtype. float32 by default (plot consumption);
+        export paths that need full coordinate precision pass np.float64.
 
     Returns
     -------
     r, z : np.ndarray
         Arrays of shape (N,) giving the closed profile.
         First and last points are identical (r[0]==r[-1], z[0]==z[-1]).
+        Both are views into one (N, 2) buffer.
 
     Segment map
     -----------
@@ -227,54 +511,45 @@ def build_cross_section(
     8. Apex flat         : r = 0, z  z_apex_outer → z_apex_inner (closes loop)
     """
     g = compute_derived_geometry(D, R_c, r_k, t, h)
+    return build_cross_section_from_geometry(g, n_arc, dtype)
 
-    r_kc = D / 2 - r_k  # knuckle arc centre, radial
-    z_kc = h             # knuckle arc centre, axial
-
-    rs, zs = [], []  # will collect (r-array, z-array) per segment
-
-    def append(r_arr, z_arr, last: bool = False) -> None:
-        """Add segment, dropping the last point unless it is the final one."""
-        rs.append(r_arr if last else r_arr[:-1])
-        zs.append(z_arr if last else z_arr[:-1])
 
-    # 1. Inner crown arc: phi 0 → phi_t
-    sr, sz = _arc_crown(g.R_c, g.z_sc, 0.0, g.phi_t, n_arc)
-    append(sr, sz)
-
-    # 2. Inner knuckle arc: theta alpha → 0
-    sr, sz = _arc_knuckle(r_kc, z_kc, r_k, g.alpha, 0.0, n_arc)
-    append(sr, sz)
-
-    # 3. Inner straight flange: z h → 0
-    append(np.array([D / 2, D / 2]), np.array([h, 0.0]))
-
-    # 4. Bottom rim: r D/2 → D/2+t
-    append(np.array([D / 2, D / 2 + t]), np.array([0.0, 0.0]))
-
-    # 5. Outer straight flange: z 0 → h
-    append(np.array([D / 2 + t, D / 2 + t]), np.array([0.0, h]))
+def build_cross_section_from_geometry(
+    g: HeadGeometry, n_arc: int = 64, dtype: np.dtype = _PROFILE_DTYPE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """build_cross_section for an already-computed HeadGeometry.
 
-    # 6. Outer knuckle arc: theta 0 → alpha
-    sr, sz = _arc_knuckle(r_kc, z_kc, r_k + t, 0.0, g.alpha, n_arc)
-    append(sr, sz)
+    Lets callers that also need the derived geometry (e.g. the 2D
+    validation plot) compute it once and skip revalidation here.
+    """
+    prof = _build_profile(g, n_arc, dtype)
+    return prof[:, 0], prof[:, 1]
 
-    # 7. Outer crown arc: phi phi_t → 0
-    sr, sz = _arc_crown(g.R_c + t, g.z_sc, g.phi_t, 0.0, n_arc)
-    append(sr, sz)
 
-    # 8. Apex flat: r=0, z_apex_outer → z_apex_inner  (closes the loop)
-    append(np.array([0.0, 0.0]), np.array([g.z_apex_outer, g.z_apex_inner]),
-           last=True)
+def build_cross_section_path(
+    D: float, R_c: float, r_k: float, t: float, h: float,
+    n_arc: int = 64,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build the closed profile as matplotlib-Path-ready (xy, codes) arrays.
 
-    r = np.concatenate(rs)
-    z = np.concatenate(zs)
+    Consumers that feed the profile into matplotlib can construct
+    ``matplotlib.path.Path(xy, codes)`` directly — the (N, 2) vertex array
+    is the profile buffer itself, so no column_stack of two 1-D arrays is
+    needed. (Path still converts to its own float64 storage internally.)
 
-    # Explicitly close the loop
-    r = np.append(r, r[0])
-    z = np.append(z, z[0])
+    Returns
+    -------
+    xy : np.ndarray, shape (N, 2)
+        Closed profile vertices, columns (r, z).
+    codes : np.ndarray, shape (N,)
+        Path codes: MOVETO for the first vertex, LINETO for the rest.
+    """
+    from matplotlib.path import Path  # deferred — geometry has no hard mpl dependency
 
-    return r, z
+    xy = _build_profile(compute_derived_geometry(D, R_c, r_k, t, h), n_arc)
+    codes = np.full(xy.shape[0], Path.LINETO, dtype=Path.code_type)
+    codes[0] = Path.MOVETO
+    return xy, codes
 
 
 def build_cross_section_segments(
@@ -303,6 +578,17 @@ def build_cross_section_segments(
         Derived geometry for this head.
     """
     g = compute_derived_geometry(D, R_c, r_k, t, h)
+    return build_cross_section_segments_from_geometry(g, n_arc), g
+
+
+def build_cross_section_segments_from_geometry(
+    g: HeadGeometry, n_arc: int = 64
+) -> list[tuple[str, np.ndarray, np.ndarray]]:
+    """build_cross_section_segments for an already-computed HeadGeometry.
+
+    Returns only the segment list — the caller already holds g.
+    """
+    D, r_k, t, h = g.D, g.r_k, g.t, g.h
     r_kc = D / 2 - r_k
     z_kc = h
 
@@ -315,13 +601,13 @@ def build_cross_section_segments(
     segs.append(("Inner knuckle arc", r, z))
 
     segs.append(("Inner straight flange",
-                 np.array([D / 2, D / 2]), np.array([h, 0.0])))
+                 _pair(D / 2, D / 2), _pair(h, 0.0)))
 
     segs.append(("Bottom rim",
-                 np.array([D / 2, D / 2 + t]), np.array([0.0, 0.0])))
+                 _pair(D / 2, D / 2 + t), _pair(0.0, 0.0)))
 
     segs.append(("Outer straight flange",
-                 np.array([D / 2 + t, D / 2 + t]), np.array([0.0, h])))
+                 _pair(D / 2 + t, D / 2 + t), _pair(0.0, h)))
 
     r, z = _arc_knuckle(r_kc, z_kc, r_k + t, 0.0, g.alpha, n_arc)
     segs.append(("Outer knuckle arc", r, z))
@@ -330,7 +616,7 @@ def build_cross_section_segments(
     segs.append(("Outer crown arc", r, z))
 
     segs.append(("Apex flat",
-                 np.array([0.0, 0.0]),
-                 np.array([g.z_apex_outer, g.z_apex_inner])))
+                 _pair(0.0, 0.0),
+                 _pair(g.z_apex_outer, g.z_apex_inner)))
 
-    return segs, g
+    return segs
@@ -4,12 +4,15 @@ How it works
 ------------
 A small matplotlib window displays four buttons, one for each view.
 Clicking a button:
-  1. Closes the launcher window.
+  1. Hides the launcher window.
   2. Opens the selected plot in a full-size window.
-  3. When that plot window is closed, the launcher reopens automatically.
+  3. When that plot window is closed, the launcher reappears automatically.
 
-This "modal loop" means only one plot is ever rendered at a time, which
-solves the performance problem of rendering multiple 3D surfaces at once.
+Only one plot is ever rendered at a time, which solves the performance
+problem of rendering multiple 3D surfaces at once. The launcher figure
+(4 Axes, 4 Buttons and all text artists) is built exactly once and
+hidden/re-shown between views rather than destroyed and rebuilt on every
+round-trip.
 
 The 3D mesh is built once at startup and reused for all 3D views.
 Mesh resolution is set to a moderate value (n_meridional=64, n_azimuthal=60)
@@ -42,6 +45,10 @@ Views available
 
 from __future__ import annotations
 
+from functools import lru_cache, partial
+
+import numpy as np
+
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
@@ -84,41 +91,105 @@ _BUTTONS = [
 _BTN_COLOR       = "#e8f0fe"
 _BTN_HOVER_COLOR = "#b8d0f0"
 
+# Legend handles for the zone-coloured views, built once at import time —
+# Patch construction goes through matplotlib's property-resolution
+# machinery, so rebuilding them per view is wasted work.
+_ZONE_PATCHES = [
+    Patch(facecolor=color, label=f"{i + 1}. {name}", alpha=0.9)
+    for i, (name, color) in enumerate(SEGMENT_COLORS.items())
+]
+_HALF_PATCHES = _ZONE_PATCHES + [
+    Patch(facecolor=CUT_FACE_COLOR, edgecolor=CUT_FACE_EDGE,
+          label="9. Cut face (wall cross-section)"),
+]
+
 
 # ---------------------------------------------------------------------------
-# Mesh cache  (built once, reused for all 3D views)
+# Mesh cache  (keyed on the full parameter set, reused for all 3D views)
 # ---------------------------------------------------------------------------
-_mesh = None
+
+@lru_cache(maxsize=4)
+def _cached_mesh(D: float, R_c: float, r_k: float, t: float, h: float,
+                 n_mer: int, n_az: int):
+    """Build (or return the cached) 3D mesh for one parameter set.
+
+    Keying on the parameters (rather than a singleton global) means the
+    cache invalidates itself if the module constants are ever edited or a
+    future parameter editor changes them at runtime.
+    """
+    print("Building mesh … ", end="", flush=True)
+    # float32 grids: the mesh only ever feeds matplotlib here, and halving
+    # the bytes halves the memory traffic of every redraw.
+    mesh = build_head_mesh(D, R_c, r_k, t, h,
+                           n_meridional=n_mer,
+                           n_azimuthal=n_az,
+                           dtype=np.float32)
+    print("done.")
+    return mesh
 
 
 def _get_mesh():
-    """Build (or return the cached) 3D mesh."""
-    global _mesh
-    if _mesh is None:
-        print("Building mesh … ", end="", flush=True)
-        _mesh = build_head_mesh(
-            D, R_c, r_k, t, h,
-            n_meridional=N_MER,
-            n_azimuthal=N_AZ,
-        )
-        print("done.")
-    return _mesh
+    """Return the cached 3D mesh for the current module parameters."""
+    return _cached_mesh(D, R_c, r_k, t, h, N_MER, N_AZ)
+
+
+# ---------------------------------------------------------------------------
+# Window hide/show helpers
+# (Tk backend: withdraw/deiconify keeps the window object alive.  Other
+#  backends fall back to doing nothing — the launcher simply stays visible
+#  behind the plot window, which is harmless.)
+# ---------------------------------------------------------------------------
+
+def _hide_fig(fig: plt.Figure) -> None:
+    """Hide a figure window without destroying the figure."""
+    try:
+        fig.canvas.manager.window.withdraw()
+    except AttributeError:
+        pass
+
+
+def _show_fig(fig: plt.Figure) -> None:
+    """Re-show a figure window previously hidden with _hide_fig."""
+    try:
+        fig.canvas.manager.window.deiconify()
+    except AttributeError:
+        pass
 
 
 # ---------------------------------------------------------------------------
 # View openers
 # ---------------------------------------------------------------------------
 
+# Persistent 3D figure, shared by all 3D views. Tearing down and rebuilding
+# an Axes3D (and its Poly3DCollections) costs >100 ms per view; reusing the
+# figure reduces a view switch to an ax.clear() plus the replot itself.
+_view_fig: plt.Figure | None = None
+
+
+def _get_view_fig() -> tuple[plt.Figure, "Axes3D"]:
+    """Return (fig, ax3d), reusing the cached 3D view figure if still open."""
+    global _view_fig
+    if _view_fig is not None and plt.fignum_exists(_view_fig.number):
+        fig = _view_fig
+        fig.legends.clear()   # per-view legends are rebuilt by the caller
+        ax = fig.axes[0]
+        ax.clear()
+    else:
+        fig = plt.figure(figsize=(9, 8))
+        ax = fig.add_subplot(111, projection="3d")
+        _view_fig = fig
+    return fig, ax
+
+
 def _open_view(view_key: str) -> None:
-    """Open the plot corresponding to view_key in a new figure window."""
+    """Open the plot corresponding to view_key in a figure window."""
 
     if view_key == "2d":
         plot_cross_section_validation(D, R_c, r_k, t, h)
 
     elif view_key == "simple":
         mesh = _get_mesh()
-        fig  = plt.figure(figsize=(9, 7))
-        ax   = fig.add_subplot(111, projection="3d")
+        fig, ax = _get_view_fig()
         plot_3d_head(mesh, ax,
                      zone_colors=False,
                      alpha=0.80,
@@ -131,8 +202,7 @@ def _open_view(view_key: str) -> None:
 
     elif view_key == "zones":
         mesh = _get_mesh()
-        fig  = plt.figure(figsize=(9, 8))
-        ax   = fig.add_subplot(111, projection="3d")
+        fig, ax = _get_view_fig()
         plot_3d_head(mesh, ax,
                      zone_colors=True,
                      alpha=0.88,
@@ -141,11 +211,7 @@ def _open_view(view_key: str) -> None:
             "3D Zone-Coloured — cross-reference with 2D validation\n"
             f"D={D:.0f}  Rc={R_c:.0f}  rk={r_k:.0f}  t={t:.0f}  h={h:.0f}  (mm)"
         )
-        legend_handles = [
-            Patch(facecolor=color, label=f"{i + 1}. {name}", alpha=0.9)
-            for i, (name, color) in enumerate(SEGMENT_COLORS.items())
-        ]
-        fig.legend(handles=legend_handles,
+        fig.legend(handles=_ZONE_PATCHES,
                    loc="lower center", ncol=4,
                    fontsize=8.5, framealpha=0.93,
                    bbox_to_anchor=(0.5, 0.01))
@@ -154,8 +220,7 @@ def _open_view(view_key: str) -> None:
 
     elif view_key == "half":
         mesh = _get_mesh()
-        fig  = plt.figure(figsize=(9, 8))
-        ax   = fig.add_subplot(111, projection="3d")
+        fig, ax = _get_view_fig()
         plot_3d_head(mesh, ax,
                      half_section=True,
                      show_cut_face=True,
@@ -167,14 +232,7 @@ def _open_view(view_key: str) -> None:
             "3D Half-Section — wall thickness visible at cut plane\n"
             f"D={D:.0f}  Rc={R_c:.0f}  rk={r_k:.0f}  t={t:.0f}  h={h:.0f}  (mm)"
         )
-        legend_handles = [
-            Patch(facecolor=color, label=f"{i + 1}. {name}", alpha=0.9)
-            for i, (name, color) in enumerate(SEGMENT_COLORS.items())
-        ] + [
-            Patch(facecolor=CUT_FACE_COLOR, edgecolor=CUT_FACE_EDGE,
-                  label="9. Cut face (wall cross-section)"),
-        ]
-        fig.legend(handles=legend_handles,
+        fig.legend(handles=_HALF_PATCHES,
                    loc="lower center", ncol=3,
                    fontsize=8.5, framealpha=0.93,
                    bbox_to_anchor=(0.5, 0.01))
@@ -235,7 +293,6 @@ def _build_launcher() -> tuple[plt.Figure, list[Button]]:
     btn_l, btn_w = 0.10, 0.80
 
     buttons: list[Button] = []
-    selection: list[str | None] = [None]   # mutable container for callback
 
     for i, (label, view_key) in enumerate(_BUTTONS):
         y = btn_ybot + (len(_BUTTONS) - 1 - i) * (btn_h + btn_gap)
@@ -245,14 +302,9 @@ def _build_launcher() -> tuple[plt.Figure, list[Button]]:
         btn.label.set_fontsize(10)
         btn.label.set_color("#1a2a4a")
 
-        # Closure: capture view_key for this iteration
-        def make_cb(key: str):
-            def cb(event):
-                selection[0] = key
-                plt.close(fig)      # closes launcher → plt.show() returns
-            return cb
-
-        btn.on_clicked(make_cb(view_key))
+        # partial binds (fig, view_key) at C level — no per-button Python
+        # closure and cell objects to allocate.
+        btn.on_clicked(partial(_on_button_click, fig, view_key))
         buttons.append(btn)   # keep reference alive
 
     # Footer note
@@ -263,7 +315,33 @@ def _build_launcher() -> tuple[plt.Figure, list[Button]]:
         fontsize=7.5, color="#999999",
     )
 
-    return fig, buttons, selection
+    return fig, buttons
+
+
+def _on_button_click(launcher_fig: plt.Figure, view_key: str, event) -> None:
+    """Launcher button callback (bound via functools.partial)."""
+    _launch_view(launcher_fig, view_key)
+
+
+def _launch_view(launcher_fig: plt.Figure, view_key: str) -> None:
+    """Open the view for view_key, hiding the launcher while it is shown.
+
+    Called from the launcher button callbacks. The launcher window is
+    hidden (not closed) and re-shown when the plot window is closed, so
+    the launcher figure and its widgets survive the whole session.
+    """
+    _open_view(view_key)
+    view_fig = plt.gcf()
+    if view_fig is launcher_fig:
+        return   # view failed to open — keep the launcher up
+
+    def reshow_launcher(event):
+        if plt.fignum_exists(launcher_fig.number):
+            _show_fig(launcher_fig)
+
+    view_fig.canvas.mpl_connect("close_event", reshow_launcher)
+    _hide_fig(launcher_fig)
+    view_fig.show()
 
 
 # ---------------------------------------------------------------------------
@@ -273,27 +351,15 @@ def _build_launcher() -> tuple[plt.Figure, list[Button]]:
 def launch_gui() -> None:
     """Run the launcher GUI.
 
-    This is a blocking call — it returns only when the launcher window is
-    closed without selecting a view (i.e. the user is done).
+    This is a blocking call — it returns when the launcher window (and any
+    open plot window) is closed.
 
-    The flow is a simple modal loop:
-        while True:
-            show launcher  (blocking)
-            if user closed without clicking  → break
-            open selected plot               (blocking)
-            ↑ loops back to launcher
+    The launcher figure is built exactly once. Clicking a button hides it
+    and opens the selected plot; closing the plot window re-shows the same
+    launcher. Closing the launcher itself ends the session.
     """
-    while True:
-        fig, buttons, selection = _build_launcher()
-        plt.show()   # ← blocks until launcher fig is closed
-
-        if selection[0] is None:
-            # User closed the launcher window directly — exit
-            break
-
-        _open_view(selection[0])
-        plt.show()   # ← blocks until the plot window is closed
-        # Loop: launcher will reopen
+    fig, buttons = _build_launcher()
+    plt.show()   # ← blocks until every window is closed
 
 
 if __name__ == "__main__":
@@ -14,47 +14,86 @@ Public API
 ----------
   revolve_profile(r, z, n_az)                           → (X, Y, Z, theta)
   build_head_mesh(D, R_c, r_k, t, h, n_mer, n_az)      → HeadMesh
-  segment_row_ranges(n_arc)                              → list of (name, start, end)
+  segment_row_ranges(n_arc)                              → tuple of (name, start, end)
+  write_stl(mesh, path)                                  → binary STL file
 """
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 from dataclasses import dataclass, field
 
 from geometry import build_cross_section, compute_derived_geometry, HeadGeometry
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional — NumPy paths cover everything
+    _HAVE_NUMBA = False
+
+try:
+    import cupy
+    _HAVE_CUPY = True
+except ImportError:  # cupy is optional — only needed for device="cuda"
+    _HAVE_CUPY = False
+
+# Grid cell count above which the parallel numba kernel (when available)
+# is used for the revolution: below it the broadcast-multiply NumPy path
+# wins because thread fan-out costs more than the work saved.
+_NUMBA_MIN_CELLS = 250_000
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _revolve_kernel(r, ct, st, X, Y):
+        """Fused X/Y fill: X[i,j] = r[i]·ct[j], Y[i,j] = r[i]·st[j]."""
+        for i in prange(r.shape[0]):
+            ri = r[i]
+            for j in range(ct.shape[0]):
+                X[i, j] = ri * ct[j]
+                Y[i, j] = ri * st[j]
+
 
 # ---------------------------------------------------------------------------
 # Mesh dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass
 class HeadMesh:
     """Structured 3D surface mesh of a torospherical head.
 
-    Grid arrays have shape (n_profile, n_az + 1):
+    The derived scalar properties below are cached_property — computed on
+    first access, then plain attribute lookups. (That is also why the
+    dataclass is not frozen: cached_property needs instance storage.
+    Treat instances as immutable regardless.)
+
+    Grid arrays have shape (n_profile, n_az):
       - Axis 0 (rows)    : meridional direction — along the profile
       - Axis 1 (columns) : azimuthal direction — angle θ around the axis
 
-    The last column is identical to the first (θ = 2π ≡ θ = 0) to produce
-    a watertight closed revolution. Similarly, the first and last profile
-    rows are the same point (the profile is closed) to seal the solid.
+    The grids are stored *open*: column n_az − 1 is the last distinct
+    azimuth, and closure (θ = 2π ≡ θ = 0) is by wrap-around index
+    arithmetic or by ``closed_grids`` when a consumer needs the seam
+    column materialized (matplotlib surface plots do). The first and last
+    profile rows are the same point (the profile is closed) to seal the
+    solid meridionally.
 
     Fields
     ------
-    X, Y, Z : np.ndarray, shape (n_profile, n_az+1)
-        Cartesian coordinate grids.
+    X, Y, Z : np.ndarray, shape (n_profile, n_az)
+        Cartesian coordinate grids (open along the azimuth).
     r, z_profile : np.ndarray, shape (n_profile,)
         Source 2D profile in the r-z half-plane.
-    theta : np.ndarray, shape (n_az+1,)
-        Azimuthal angles in radians, linspace(0, 2π, n_az+1).
+    theta : np.ndarray, shape (n_az,)
+        Azimuthal angles in radians, [0, 2π) — the 2π entry is implied.
     geometry : HeadGeometry
         Derived geometric quantities.
     n_meridional : int
         Arc samples per segment used when building the source profile.
     n_azimuthal : int
-        Number of azimuthal subdivisions (columns = n_azimuthal + 1).
+        Number of azimuthal subdivisions (= number of grid columns).
     """
     X:            np.ndarray
     Y:            np.ndarray
@@ -68,28 +107,125 @@ class HeadMesh:
 
     # Convenience properties ------------------------------------------------
 
-    @property
+    @functools.cached_property
     def n_profile(self) -> int:
         """Number of points in the source profile (= X.shape[0])."""
         return self.X.shape[0]
 
-    @property
+    @functools.cached_property
     def n_quads(self) -> int:
         """Number of quadrilateral cells in the surface grid."""
         return (self.X.shape[0] - 1) * self.X.shape[1]
 
-    @property
-    def z_min(self) -> float:
-        return float(self.Z.min())
+    # The mesh is a revolution around the z-axis, so every axial/radial
+    # extreme already exists in the 1D source profile — reducing over the
+    # full 2D grids (or worse, a sqrt(X²+Y²) temporary) is pure waste.
+    # If per-cell radial distances are ever needed, use np.hypot(X, Y):
+    # one fused SIMD pass and one output array instead of the three
+    # temporaries that np.sqrt(X**2 + Y**2) materializes.
+
+    # The extents stay NumPy scalars rather than being boxed through
+    # float(): NumPy's scalar protocol makes them compare and combine with
+    # Python floats transparently, and skipping the cast avoids a fresh
+    # Python float allocation per first access. Call float() at the
+    # boundary if a genuine builtin is ever required.
+
+    @functools.cached_property
+    def z_min(self) -> np.float64:
+        return np.float64(self.z_profile.min())
+
+    @functools.cached_property
+    def z_max(self) -> np.float64:
+        return np.float64(self.z_profile.max())
+
+    @functools.cached_property
+    def r_max(self) -> np.float64:
+        """Maximum radial extent (outer flange radius = D/2 + t)."""
+        return np.float64(self.r.max())
+
+    @functools.cached_property
+    def digest(self) -> int:
+        """Cheap identity hash of the mesh's defining parameters.
+
+        Two meshes with equal digests have identical grids (the geometry
+        dataclass is frozen and the builders are deterministic), so render
+        layers can key caches on this instead of comparing arrays.
+        """
+        return hash((self.geometry, self.n_meridional, self.n_azimuthal,
+                     self.X.dtype.str))
+
+    @functools.cached_property
+    def closed_grids(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(X, Y, Z) with the seam column θ = 2π appended.
+
+        Display consumers (plot_surface) need the duplicate closing column
+        to render a watertight revolution; everything else works on the
+        open grids. Cached so repeated redraws pay the concatenation once.
+        Z stays a stride-0 broadcast view — no extra storage.
+        """
+        Xc = np.concatenate([self.X, self.X[:, :1]], axis=1)
+        Yc = np.concatenate([self.Y, self.Y[:, :1]], axis=1)
+        Zc = np.broadcast_to(self.Z[:, :1], Xc.shape)
+        return Xc, Yc, Zc
 
-    @property
-    def z_max(self) -> float:
-        return float(self.Z.max())
 
-    @property
-    def r_max(self) -> float:
-        """Maximum radial extent (outer flange radius = D/2 + t)."""
-        return float(np.sqrt(self.X**2 + self.Y**2).max())
+# ---------------------------------------------------------------------------
+# Azimuthal trig tables
+# ---------------------------------------------------------------------------
+
+def _quadrant_trig(n_az: int, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray]:
+    """cos/sin tables for theta = linspace(0, 2π, n_az+1), n_az % 4 == 0.
+
+    The closed azimuthal circle has exact quarter-turn symmetry, so only
+    θ ∈ [0, π/2] (n_az/4 + 1 points) needs real transcendentals; the other
+    three quadrants are filled by sign-flip and reversal:
+
+        cos(π − x) = −cos x     sin(π − x) =  sin x
+        cos(π + x) = −cos x     sin(π + x) = −sin x
+        cos(2π − x) =  cos x    sin(2π − x) = −sin x
+    """
+    q = n_az // 4
+    tq = np.linspace(0.0, np.pi / 2, q + 1, dtype=dtype)
+    c = np.cos(tq)
+    s = np.sin(tq)
+
+    ct = np.empty(n_az + 1, dtype=dtype)
+    st = np.empty(n_az + 1, dtype=dtype)
+    ct[:q + 1] = c                                # θ ∈ [0, π/2]
+    st[:q + 1] = s
+    ct[q + 1:2 * q + 1] = -c[q - 1::-1]           # θ ∈ (π/2, π]
+    st[q + 1:2 * q + 1] = s[q - 1::-1]
+    ct[2 * q + 1:3 * q + 1] = -c[1:q + 1]         # θ ∈ (π, 3π/2]
+    st[2 * q + 1:3 * q + 1] = -s[1:q + 1]
+    ct[3 * q + 1:] = c[q - 1::-1]                 # θ ∈ (3π/2, 2π]
+    st[3 * q + 1:] = -s[q - 1::-1]
+    return ct, st
+
+
+@functools.lru_cache(maxsize=8)
+def _az_tables(n_az: int, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Memoized (theta, cos_theta, sin_theta) tables for n_az subdivisions.
+
+    GUI sessions rebuild meshes with the same azimuthal resolution over and
+    over; the angle and trig vectors depend only on (n_az, dtype), so they
+    are computed once and shared. The cached arrays are marked read-only —
+    every consumer only ever reads them, and the flag turns an accidental
+    in-place write into an immediate error instead of silent cache poisoning.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, n_az + 1, dtype=dtype)
+    # For the common n_az values (multiples of 4: 36, 60, 90, 180) the
+    # quarter-turn symmetry tables cut transcendental evaluations 4×;
+    # otherwise a single complex exp (e^{iθ} = cosθ + i·sinθ) still
+    # computes both in one vectorized sincos pass.
+    if n_az % 4 == 0:
+        ct, st = _quadrant_trig(n_az, dtype)
+    else:
+        e_itheta = np.exp(theta * 1j)
+        ct = e_itheta.real.copy()
+        st = e_itheta.imag.copy()
+    for arr in (theta, ct, st):
+        arr.setflags(write=False)
+    return theta, ct, st
 
 
 # ---------------------------------------------------------------------------
@@ -100,6 +236,9 @@ def revolve_profile(
     r: np.ndarray,
     z: np.ndarray,
     n_az: int = 90,
+    dtype: np.dtype = np.float64,
+    order: str = "C",
+    xp=np,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Revolve a 2D axisymmetric profile around the z-axis.
 
@@ -110,40 +249,154 @@ def revolve_profile(
         The profile need not be closed; closure is handled by the azimuthal
         wrap-around (last column = first column).
     n_az : int
-        Number of azimuthal subdivisions. The returned grids have n_az + 1
-        columns so that theta[0] = 0 and theta[-1] = 2π are both present,
-        forming a visually closed solid without any seam gaps.
+        Number of azimuthal subdivisions. The returned grids are *open* —
+        n_az columns covering θ ∈ [0, 2π) — since the θ = 2π column would
+        duplicate θ = 0. Consumers that need the seam column materialized
+        (surface plotting) append it via ``HeadMesh.closed_grids``.
+    dtype : np.dtype
+        Grid dtype. float64 by default; pass np.float32 for display-only
+        consumers (matplotlib accepts it natively) to halve the bytes
+        moved through this memory-bound kernel. float32 limits coordinates
+        to ~7 significant digits — plenty at screen resolution, not enough
+        for metrology.
+    order : {"C", "F"}
+        Memory layout of the X/Y grids. "C" (default) keeps azimuthal
+        sweeps of one profile row contiguous, which matches matplotlib's
+        plot_surface row iteration. Pass "F" for consumers that walk the
+        meridional direction column-by-column instead.
+    xp : array module
+        NumPy-compatible backend — ``numpy`` (default) or ``cupy``. The
+        revolution is an embarrassingly parallel outer product, so pass
+        cupy to build the grids directly in GPU memory when the downstream
+        consumer (FEA, GPU rendering) also lives there; the host→device
+        transfer is then just the two 1D profile vectors. Worth it only
+        above ~1e6 cells and only with a GPU consumer — matplotlib would
+        pull everything straight back to the host.
 
     Returns
     -------
-    X, Y, Z : np.ndarray, shape (N, n_az+1)
-        Cartesian grids:
+    X, Y, Z : np.ndarray, shape (N, n_az)
+        Cartesian grids (open along the azimuth):
             X[i, j] = r[i] * cos(θ[j])
             Y[i, j] = r[i] * sin(θ[j])
             Z[i, j] = z[i]
-    theta : np.ndarray, shape (n_az+1,)
-        Azimuthal angles used.
+    theta : np.ndarray, shape (n_az,)
+        Azimuthal angles used, [0, 2π). Read-only — it is a view into the
+        per-n_az memoized trig tables; copy before mutating.
 
     Notes
     -----
+    Z is a read-only broadcast view (stride 0 along theta). matplotlib's
+    plot_surface and all reductions accept it as-is; call
+    np.ascontiguousarray on it if a writeable copy is ever needed.
+
     Rows where r[i] = 0 (the centreline apex points) produce degenerate
     "pole" rows where all X[i, :] = 0 and Y[i, :] = 0. matplotlib's
     plot_surface handles these gracefully, but lighting artefacts can appear
     near the poles — managed in the visualization layer (Step 4).
     """
-    if np.any(r < 0):
+    # r.min() is a single reduction pass — np.any(r < 0) would materialize
+    # an N-length boolean temporary first.
+    if r.size and r.min() < 0.0:
         raise ValueError("All r values must be >= 0 for a valid revolution.")
 
-    theta = np.linspace(0.0, 2.0 * np.pi, n_az + 1)
-
-    # np.outer gives shape (N, n_az+1) directly
-    X = np.outer(r, np.cos(theta))
-    Y = np.outer(r, np.sin(theta))
-    Z = np.outer(z, np.ones(n_az + 1))
+    # copy=False: no-op when the profile already has the requested dtype
+    # (xp.asarray is the host→device transfer when xp is cupy)
+    r = xp.asarray(r).astype(dtype, copy=False)
+    z = xp.asarray(z).astype(dtype, copy=False)
+
+    if xp is np:
+        # Angle and trig tables are memoized per (n_az, dtype) — see
+        # _az_tables. The tables span the closed circle (n_az + 1 entries);
+        # the open grids use the first n_az columns and the seam is implied
+        # by wrap-around.
+        theta, ct, st = _az_tables(n_az, dtype)
+        theta, ct, st = theta[:n_az], ct[:n_az], st[:n_az]
+    else:
+        # Device path: trig on 1D vectors is a rounding error next to the
+        # grid fill, so the host-side caching/symmetry tricks buy nothing.
+        theta = xp.linspace(0.0, 2.0 * np.pi, n_az + 1, dtype=dtype)[:n_az]
+        ct = xp.cos(theta)
+        st = xp.sin(theta)
+
+    # Broadcast-multiply straight into preallocated grids: cos/sin are
+    # evaluated once on the 1D theta vector and the (N, n_az) outputs are
+    # written in a single pass each — no np.outer temporaries.
+    X = xp.empty((r.shape[0], n_az), dtype=dtype, order=order)
+    Y = xp.empty_like(X)
+    if xp is np and _HAVE_NUMBA and X.size >= _NUMBA_MIN_CELLS:
+        # Parallel fused loop: both grids filled in one pass per row, no
+        # NumPy dispatch per output array.
+        _revolve_kernel(r, ct, st, X, Y)
+    else:
+        r_col = r.reshape(-1, 1)
+        xp.multiply(r_col, ct, out=X)
+        xp.multiply(r_col, st, out=Y)
+    # Z is constant along theta: a stride-0 broadcast view costs nothing to
+    # build and nothing to store (the old np.outer against an all-ones
+    # vector did a full multiply and materialized the grid).
+    Z = xp.broadcast_to(z.reshape(-1, 1), X.shape)
 
     return X, Y, Z, theta
 
 
+def iter_mesh_strips(
+    r: np.ndarray,
+    z: np.ndarray,
+    n_az: int = 90,
+    dtype: np.dtype = np.float64,
+):
+    """Yield the revolution one azimuthal strip at a time.
+
+    Pure-export workflows (STL, glTF, CSV) walk the grid strip by strip and
+    never need the full X/Y/Z arrays resident at once. This generator keeps
+    peak memory at O(n_az) regardless of profile density, which makes
+    n_meridional ≥ 2048 exports feasible on small machines where the
+    materialized (N, n_az+1) grids would not fit comfortably.
+
+    Parameters
+    ----------
+    r, z : np.ndarray, shape (N,)
+        Profile coordinates in the r-z half-plane (same contract as
+        ``revolve_profile``).
+    n_az : int
+        Azimuthal subdivisions; each strip has n_az + 1 columns so the
+        seam column (θ = 2π ≡ 0) is present — streamed consumers get
+        watertight strips without doing their own wrap-around.
+    dtype : np.dtype
+        Strip dtype.
+
+    Yields
+    ------
+    (X_strip, Y_strip, z_pair) : np.ndarray triples
+        X_strip, Y_strip have shape (2, n_az+1) and hold profile rows
+        i and i+1; z_pair has shape (2,). One triple per quad row
+        (N − 1 in total). The arrays are freshly written each iteration —
+        consumers that keep a strip past the next ``next()`` call must
+        copy it, because the two row buffers are reused in rotation.
+    """
+    if r.size and r.min() < 0.0:
+        raise ValueError("All r values must be >= 0 for a valid revolution.")
+
+    r = np.asarray(r).astype(dtype, copy=False)
+    z = np.asarray(z).astype(dtype, copy=False)
+    _, ct, st = _az_tables(n_az, dtype)
+
+    # Two-row sliding buffers: each iteration shifts the previous top row
+    # down and computes only the one new row, so per-yield work is a single
+    # scalar-vector multiply pair.
+    X = np.empty((2, n_az + 1), dtype=dtype)
+    Y = np.empty_like(X)
+    np.multiply(r[0], ct, out=X[1])
+    np.multiply(r[0], st, out=Y[1])
+    for i in range(r.shape[0] - 1):
+        X[0] = X[1]
+        Y[0] = Y[1]
+        np.multiply(r[i + 1], ct, out=X[1])
+        np.multiply(r[i + 1], st, out=Y[1])
+        yield X, Y, z[i:i + 2]
+
+
 # ---------------------------------------------------------------------------
 # Top-level mesh builder
 # ---------------------------------------------------------------------------
@@ -152,6 +405,8 @@ def build_head_mesh(
     D: float, R_c: float, r_k: float, t: float, h: float,
     n_meridional: int = 128,
     n_azimuthal:  int = 90,
+    dtype: np.dtype = np.float64,
+    device: str = "cpu",
 ) -> HeadMesh:
     """Build the complete 3D structured surface mesh of a torospherical head.
 
@@ -164,9 +419,18 @@ def build_head_mesh(
         Total profile points ≈ 6 * n_meridional + 6 straight-segment points.
         Recommended: 64–256 depending on required smoothness.
     n_azimuthal : int
-        Azimuthal subdivisions around the axis.
-        Total azimuthal columns = n_azimuthal + 1.
+        Azimuthal subdivisions around the axis (= open-grid columns).
         Recommended: 60–180 for display; 360 for near-cylindrical accuracy.
+    dtype : np.dtype
+        Grid dtype, forwarded to both the profile builder and
+        revolve_profile, so float64 meshes carry full-precision profile
+        coordinates end to end. Use np.float32 when the mesh only feeds
+        matplotlib (see revolve_profile for the tradeoff).
+    device : {"cpu", "cuda"}
+        "cuda" builds the coordinate grids in GPU memory via cupy (see the
+        ``xp`` parameter of revolve_profile); requires cupy and only pays
+        off when the mesh feeds a GPU consumer. The matplotlib views in
+        this project need a "cpu" mesh.
 
     Returns
     -------
@@ -179,9 +443,20 @@ def build_head_mesh(
     For high-quality render/export:     n_meridional=256, n_azimuthal=180
     For quick validation:               n_meridional=32,  n_azimuthal=36
     """
+    if device == "cuda":
+        if not _HAVE_CUPY:
+            raise ImportError("device='cuda' requires the optional cupy package.")
+        xp = cupy
+    elif device == "cpu":
+        xp = np
+    else:
+        raise ValueError(f"device must be 'cpu' or 'cuda', got {device!r}")
+
     g = compute_derived_geometry(D, R_c, r_k, t, h)
-    r_prof, z_prof = build_cross_section(D, R_c, r_k, t, h, n_arc=n_meridional)
-    X, Y, Z, theta = revolve_profile(r_prof, z_prof, n_az=n_azimuthal)
+    r_prof, z_prof = build_cross_section(D, R_c, r_k, t, h,
+                                         n_arc=n_meridional, dtype=dtype)
+    X, Y, Z, theta = revolve_profile(r_prof, z_prof, n_az=n_azimuthal,
+                                     dtype=dtype, xp=xp)
 
     return HeadMesh(
         X=X, Y=Y, Z=Z,
@@ -194,11 +469,78 @@ def build_head_mesh(
     )
 
 
+# ---------------------------------------------------------------------------
+# Binary STL export
+# ---------------------------------------------------------------------------
+
+# 50-byte binary STL triangle record (little-endian, 2-byte attribute)
+_STL_TRI_DTYPE = np.dtype([
+    ("normal", "<f4", 3),
+    ("v1",     "<f4", 3),
+    ("v2",     "<f4", 3),
+    ("v3",     "<f4", 3),
+    ("attr",   "<u2"),
+])
+
+
+def write_stl(mesh: HeadMesh, path: str) -> None:
+    """Write the mesh as a binary STL file.
+
+    The whole triangulation is a vectorized pass over the structured grid —
+    each quad cell splits into two triangles, normals come from one batched
+    np.cross, and the records stream to disk via a single structured-array
+    tofile. No Python-level per-triangle loop (and no matplotlib involved).
+
+    Degenerate triangles (the pole rows where r = 0 collapse to a point)
+    are kept with a zero normal, which STL consumers ignore.
+
+    Parameters
+    ----------
+    mesh : HeadMesh
+        Mesh produced by ``build_head_mesh``.
+    path : str
+        Output file path (conventionally ``.stl``).
+    """
+    X, Y, Z = mesh.X, mesh.Y, mesh.Z
+
+    # The grids are open along the azimuth, so the seam quad wraps back to
+    # column 0 via index arithmetic — no duplicate closing column needed.
+    jp1 = np.arange(1, X.shape[1] + 1)
+    jp1[-1] = 0
+
+    # Quad corner grids, shape (n_profile-1, n_az, 3)
+    p00 = np.stack([X[:-1, :],   Y[:-1, :],   Z[:-1, :]],   axis=-1).reshape(-1, 3)
+    p01 = np.stack([X[:-1, jp1], Y[:-1, jp1], Z[:-1, jp1]], axis=-1).reshape(-1, 3)
+    p11 = np.stack([X[1:, jp1],  Y[1:, jp1],  Z[1:, jp1]],  axis=-1).reshape(-1, 3)
+    p10 = np.stack([X[1:, :],    Y[1:, :],    Z[1:, :]],    axis=-1).reshape(-1, 3)
+
+    # Two triangles per quad, consistent winding: (p00, p01, p11), (p00, p11, p10)
+    v1 = np.concatenate([p00, p00])
+    v2 = np.concatenate([p01, p11])
+    v3 = np.concatenate([p11, p10])
+
+    normals = np.cross(v2 - v1, v3 - v1)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    records = np.zeros(v1.shape[0], dtype=_STL_TRI_DTYPE)
+    records["normal"] = normals
+    records["v1"] = v1
+    records["v2"] = v2
+    records["v3"] = v3
+
+    with open(path, "wb") as f:
+        f.write(b"torosphere binary STL".ljust(80, b"\0"))
+        f.write(np.uint32(records.shape[0]).tobytes())
+        records.tofile(f)
+
+
 # ---------------------------------------------------------------------------
 # Segment row-range map  (used by the visualization layer)
 # ---------------------------------------------------------------------------
 
-def segment_row_ranges(n_arc: int) -> list[tuple[str, int, int]]:
+@functools.lru_cache(maxsize=16)
+def segment_row_ranges(n_arc: int) -> tuple[tuple[str, int, int], ...]:
     """Return the profile row index range for each of the 8 cross-section segments.
 
     Used by the visualization layer to colour-code the 3D surface by zone —
@@ -213,7 +555,9 @@ def segment_row_ranges(n_arc: int) -> list[tuple[str, int, int]]:
 
     Returns
     -------
-    list of (name, start_row, end_row) tuples
+    tuple of (name, start_row, end_row) tuples
+        (Immutable, and memoized per n_arc — only a handful of values ever
+        occur in practice.)
         ``start_row`` : first row index for this zone in the mesh grid.
         ``end_row``   : last row index (inclusive).
         Slice the mesh as ``X[start_row : end_row + 1, :]`` for plot_surface.
@@ -271,5 +615,5 @@ def segment_row_ranges(n_arc: int) -> list[tuple[str, int, int]]:
     for i, (name, start) in enumerate(zip(names, starts)):
         end = starts[i + 1] if i < len(starts) - 1 else n_last
         result.append((name, start, end))
-    return result
+    return tuple(result)
 
@@ -12,9 +12,10 @@ from __future__ import annotations
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 
-from geometry import build_cross_section_segments, compute_derived_geometry
+from geometry import build_cross_section_segments_from_geometry, compute_derived_geometry
 
 # ---------------------------------------------------------------------------
 # Segment colour palette
@@ -56,10 +57,15 @@ def _dim_arrow(
             color=color, bbox=dict(fc="white", ec="none", pad=1.5), zorder=8)
 
 
-def _ext_line(ax: plt.Axes,
+def _ext_line(lines: list,
               x1: float, y1: float, x2: float, y2: float) -> None:
-    """Draw a thin dotted extension line (for dimension witness lines)."""
-    ax.plot([x1, x2], [y1, y2], color="#aaaaaa", lw=0.6, ls=":", zorder=1)
+    """Queue a thin dotted extension line (for dimension witness lines).
+
+    Witness lines are collected and drawn as one LineCollection at the end
+    of the plot routine — one artist for all of them instead of one Line2D
+    (and one backend draw call) per line.
+    """
+    lines.append(((x1, y1), (x2, y2)))
 
 
 # ---------------------------------------------------------------------------
@@ -90,8 +96,10 @@ def plot_cross_section_validation(
     5. Derived geometry panel — cross-check key values (z_sc, alpha, dome
        height) against hand calculations.
     """
+    # Compute the derived geometry once and hand it to the segment builder
+    # — avoids a second round of validation + trig for the same parameters.
     g = compute_derived_geometry(D, R_c, r_k, t, h)
-    segments, _ = build_cross_section_segments(D, R_c, r_k, t, h, n_arc)
+    segments = build_cross_section_segments_from_geometry(g, n_arc)
 
     r_kc = D / 2 - r_k   # knuckle centre, radial
     z_kc = h              # knuckle centre, axial
@@ -101,42 +109,64 @@ def plot_cross_section_validation(
     z_lo     = -(h + t * 9)          # room for dimension lines below flange
     z_hi     = g.z_apex_outer + t * 5
 
-    fig, ax = plt.subplots(figsize=(10, 11))
+    # constrained_layout solves the layout incrementally during draws
+    # instead of the full-figure renderer pass tight_layout needs at the end.
+    fig, ax = plt.subplots(figsize=(10, 11), constrained_layout=True)
 
     # ── Filled cross-section (both sides) ────────────────────────────────
-    r_all = np.concatenate([s[1] for s in segments])
-    z_all = np.concatenate([s[2] for s in segments])
-    ax.fill( r_all, z_all, color="#d6e4f5", alpha=0.55, zorder=1)
-    ax.fill(-r_all, z_all, color="#d6e4f5", alpha=0.55, zorder=1)
+    # Segment sizes are known, so fill one preallocated buffer per axis
+    # with a running offset — no intermediate list-of-arrays bookkeeping
+    # inside np.concatenate.
+    n_total = sum(s[1].size for s in segments)
+    r_all = np.empty(n_total, dtype=segments[0][1].dtype)
+    z_all = np.empty_like(r_all)
+    ofs = 0
+    for _, r, z in segments:
+        r_all[ofs:ofs + r.size] = r
+        z_all[ofs:ofs + r.size] = z
+        ofs += r.size
+    neg_r_all = np.negative(r_all)
+    ax.fill(r_all,     z_all, color="#d6e4f5", alpha=0.55, zorder=1)
+    ax.fill(neg_r_all, z_all, color="#d6e4f5", alpha=0.55, zorder=1)
 
     # ── Left mirror (grey, faded for visual context) ──────────────────────
-    for _, r, z in segments:
-        ax.plot(-r, z, color="#999999", lw=1.2, alpha=0.35, zorder=2)
+    # One NaN-separated polyline → one Line2D artist for all 8 segments,
+    # instead of 8 artists each with its own draw dispatch.
+    r_mir = np.concatenate([np.append(s[1], np.nan) for s in segments])
+    z_mir = np.concatenate([np.append(s[2], np.nan) for s in segments])
+    ax.plot(-r_mir, z_mir, color="#999999", lw=1.2, alpha=0.35, zorder=2)
 
     # ── Right side: colour-coded named segments ───────────────────────────
-    for name, r, z in segments:
-        ax.plot(r, z, color=SEGMENT_COLORS[name], lw=2.5, zorder=4,
-                solid_capstyle="round")
+    # One LineCollection with per-segment colours renders all 8 segments in
+    # a single vectorized backend call instead of 8 Line2D artists.
+    ax.add_collection(LineCollection(
+        [np.column_stack([r, z]) for _, r, z in segments],
+        colors=[SEGMENT_COLORS[name] for name, _, _ in segments],
+        linewidths=2.5, zorder=4, capstyle="round",
+    ))
 
     # ── Construction ghost arcs (dashed, same colour as segment, faded) ──
     phi_ext   = np.linspace(0.0, g.phi_t * 1.12, 80)
     theta_ext = np.linspace(-0.08, g.alpha + 0.12, 80)
 
+    # The inner and outer ghost arcs differ only by radius, so the trig on
+    # the shared angle vectors is evaluated once and scaled per radius.
+    sin_p, cos_p = np.sin(phi_ext), np.cos(phi_ext)
+    cos_t, sin_t = np.cos(theta_ext), np.sin(theta_ext)
+
     for radius, col in [
         (g.R_c,       SEGMENT_COLORS["Inner crown arc"]),
         (g.R_c + t,   SEGMENT_COLORS["Outer crown arc"]),
     ]:
-        rg = radius * np.sin(phi_ext)
-        zg = g.z_sc + radius * np.cos(phi_ext)
-        ax.plot(rg, zg, ls="--", color=col, lw=0.9, alpha=0.35, zorder=2)
+        ax.plot(radius * sin_p, g.z_sc + radius * cos_p,
+                ls="--", color=col, lw=0.9, alpha=0.35, zorder=2)
 
     for radius, col in [
         (r_k,       SEGMENT_COLORS["Inner knuckle arc"]),
         (r_k + t,   SEGMENT_COLORS["Outer knuckle arc"]),
     ]:
-        rg = r_kc + radius * np.cos(theta_ext)
-        zg = z_kc + radius * np.sin(theta_ext)
-        ax.plot(rg, zg, ls="--", color=col, lw=0.9, alpha=0.35, zorder=2)
+        ax.plot(r_kc + radius * cos_t, z_kc + radius * sin_t,
+                ls="--", color=col, lw=0.9, alpha=0.35, zorder=2)
 
     # ── Tangency point markers ─────────────────────────────────────────────
     for sign in (+1, -1):
@@ -184,11 +214,12 @@ def plot_cross_section_validation(
 
     # ── Dimension annotations ─────────────────────────────────────────────
     r_outer = D / 2 + t
+    witness_lines: list = []
 
     # h — flange height (right side)
     x_h = r_outer + t * 7
-    _ext_line(ax, r_outer, 0,   x_h + t, 0)
-    _ext_line(ax, r_outer, h,   x_h + t, h)
+    _ext_line(witness_lines, r_outer, 0,   x_h + t, 0)
+    _ext_line(witness_lines, r_outer, h,   x_h + t, h)
     _dim_arrow(ax, x_h, 0, x_h, h,
                f"h={h:.0f}",
                lx=x_h + t * 3.5, ly=h / 2)
@@ -200,12 +231,18 @@ def plot_cross_section_validation(
 
     # D/2 — inside radius (below profile)
     z_D = -(h + t * 5)
-    _ext_line(ax, 0,      0,  0,      z_D - t * 0.5)
-    _ext_line(ax, D / 2,  0,  D / 2,  z_D - t * 0.5)
+    _ext_line(witness_lines, 0,      0,  0,      z_D - t * 0.5)
+    _ext_line(witness_lines, D / 2,  0,  D / 2,  z_D - t * 0.5)
     _dim_arrow(ax, 0, z_D, D / 2, z_D,
                f"D/2={D/2:.0f}",
                ly=z_D - t * 2.8)
 
+    # All queued witness lines in one artist.
+    ax.add_collection(LineCollection(
+        witness_lines, colors="#aaaaaa", linewidths=0.6,
+        linestyles=":", zorder=1,
+    ))
+
     # ── Derived geometry summary (text box) ───────────────────────────────
     osc_note = f"  (off-screen, plot clips at z={z_lo:.0f})" if g.z_sc < z_lo else ""
     summary = (
@@ -253,5 +290,4 @@ def plot_cross_section_validation(
         f"t={t:.0f}  h={h:.0f}  (mm)"
     )
     ax.grid(True, alpha=0.18)
-    plt.tight_layout()
     plt.show()
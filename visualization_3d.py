@@ -19,12 +19,55 @@ Public API
 from __future__ import annotations
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from matplotlib.colors import to_rgba
 
 from mesh_3d import HeadMesh, segment_row_ranges
 
+# matplotlib.pyplot, Patch and Poly3DCollection are imported inside the
+# functions that draw: pyplot + mplot3d are the heavyweight imports, and
+# tooling that only wants the palette or quad helpers shouldn't pay for
+# them at import time. (matplotlib.colors above is comparatively cheap.)
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional — NumPy paths cover everything
+    _HAVE_NUMBA = False
+
+try:
+    import pyvista
+    _HAVE_PYVISTA = True
+except ImportError:  # pyvista is optional — only needed for backend="pyvista"
+    _HAVE_PYVISTA = False
+
+# Quad count above which the parallel numba gather (when available) is
+# used for vertex assembly: the NumPy path allocates four intermediate
+# corner stacks, which only starts to matter once they outgrow the caches.
+_NUMBA_MIN_QUADS = 100_000
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _quads_kernel(X, Y, Z, out):
+        """Gather quad corners straight into out, one fused pass."""
+        ni = X.shape[0] - 1
+        nj = X.shape[1] - 1
+        for i in prange(ni):
+            for j in range(nj):
+                k = j * ni + i
+                out[k, 0, 0] = X[i, j]
+                out[k, 0, 1] = Y[i, j]
+                out[k, 0, 2] = Z[i, j]
+                out[k, 1, 0] = X[i, j + 1]
+                out[k, 1, 1] = Y[i, j + 1]
+                out[k, 1, 2] = Z[i, j + 1]
+                out[k, 2, 0] = X[i + 1, j + 1]
+                out[k, 2, 1] = Y[i + 1, j + 1]
+                out[k, 2, 2] = Z[i + 1, j + 1]
+                out[k, 3, 0] = X[i + 1, j]
+                out[k, 3, 1] = Y[i + 1, j]
+                out[k, 3, 2] = Z[i + 1, j]
+
 
 # ---------------------------------------------------------------------------
 # Zone colour palette  (matches visualization_2d.py for cross-reference)
@@ -44,6 +87,12 @@ SEGMENT_COLORS: dict[str, str] = {
 CUT_FACE_COLOR    = "#ccdde8"   # light steel blue — the wall cross-section fill
 CUT_FACE_EDGE     = "#5577aa"   # slightly darker edge line on the cut polygon
 
+# Hex → RGBA parsed once at import; the draw paths index these instead of
+# re-parsing colour strings on every call.
+_SEGMENT_RGBA = {name: to_rgba(c) for name, c in SEGMENT_COLORS.items()}
+_CUT_FACE_RGBA = to_rgba(CUT_FACE_COLOR, 0.80)
+_CUT_EDGE_RGBA = to_rgba(CUT_FACE_EDGE, 0.80)
+
 
 # ---------------------------------------------------------------------------
 # Private helpers
@@ -60,38 +109,187 @@ def _set_equal_aspect(ax: "Axes3D", mesh: HeadMesh) -> None:
     to match the actual data extents, correcting this distortion.
 
     The same ranges are used for both the full and half-section views so
-    that both subplots share a common visual scale.
+    that both subplots share a common visual scale. The aspect tuple is
+    cached on the mesh — the extents never change for a given mesh.
+    """
+    ba = getattr(mesh, "_box_aspect", None)
+    if ba is None:
+        xy = mesh.r_max * 2                    # full diameter extent
+        ba = (xy, xy, mesh.z_max - mesh.z_min)  # z: total axial height
+        mesh._box_aspect = ba
+    ax.set_box_aspect(ba)
+
+
+def _lod_indices(n: int, stride: int) -> np.ndarray:
+    """Row/column indices for subsampling a grid axis by ``stride``.
+
+    Always includes the final index so strided surfaces keep their exact
+    boundary (plot_surface's rstride/cstride behave the same way).
+    """
+    idx = np.arange(0, n, stride)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return idx
+
+
+def _display_grids(mesh: HeadMesh) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Closed X/Y/Z grids as contiguous float32, cached on the mesh.
+
+    matplotlib's 3D projection renders in single precision anyway, so
+    feeding it float64 grids just doubles the bytes pushed through the
+    projection pipeline every draw. The cast happens once per mesh; for
+    meshes already built with dtype=np.float32 (the GUI path)
+    ascontiguousarray is a no-copy pass-through for X and Y.
+    """
+    if not hasattr(mesh, "_grids32"):
+        Xc, Yc, Zc = mesh.closed_grids
+        mesh._grids32 = (
+            np.ascontiguousarray(Xc, dtype=np.float32),
+            np.ascontiguousarray(Yc, dtype=np.float32),
+            np.ascontiguousarray(Zc, dtype=np.float32),
+        )
+    return mesh._grids32
+
+
+def _surface_quads(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+    """Assemble the (n_quads, 4, 3) quad vertex array of a structured grid.
+
+    One vectorized gather replaces the per-quad Python list construction
+    that plot_surface performs internally — which profiling shows is the
+    dominant cost of zone-coloured draws, not the rendering itself. The
+    counter-clockwise corner order matches plot_surface's quads.
+
+    Quads are ordered azimuth-outer (column-major over the grid): all
+    quads of column 0 first, then column 1, and so on. For closed grids
+    whose columns sweep θ = 0 → 2π this makes the y ≥ 0 half-section
+    exactly the first half of the buffer, so a half view is a prefix
+    slice of the full view's array — no rebuild (see _zone_quad_arrays).
+
+    Large meshes go through the parallel numba kernel (when installed),
+    which writes the buffer in one fused pass instead of materializing
+    four intermediate corner stacks first.
+    """
+    n_quads = (X.shape[0] - 1) * (X.shape[1] - 1)
+    if _HAVE_NUMBA and n_quads >= _NUMBA_MIN_QUADS:
+        out = np.empty((n_quads, 4, 3), dtype=X.dtype)
+        _quads_kernel(X, Y, Z, out)
+        return out
+    corners = (
+        (X[:-1, :-1], Y[:-1, :-1], Z[:-1, :-1]),
+        (X[:-1, 1:],  Y[:-1, 1:],  Z[:-1, 1:]),
+        (X[1:, 1:],   Y[1:, 1:],   Z[1:, 1:]),
+        (X[1:, :-1],  Y[1:, :-1],  Z[1:, :-1]),
+    )
+    verts = np.stack([np.stack(c, axis=-1) for c in corners], axis=2)
+    return verts.transpose(1, 0, 2, 3).reshape(-1, 4, 3)
+
+
+def _zone_quad_arrays(mesh: HeadMesh) -> tuple[np.ndarray, np.ndarray, int]:
+    """Full-revolution zone quads + colours, cached on the mesh.
+
+    Returns (verts, facecolors, n_half_quads) where verts[:n_half_quads]
+    are exactly the y ≥ 0 quads (θ ∈ [0, π]) thanks to the azimuth-outer
+    ordering of _surface_quads. plot_head_comparison therefore builds the
+    arrays once and both panels share them — the half panel is a prefix
+    view, halving quad-construction work and reusing warm cache lines.
     """
-    xy = mesh.r_max * 2               # full diameter extent
-    z  = mesh.z_max - mesh.z_min      # total axial height
-    ax.set_box_aspect((xy, xy, z))
+    if not hasattr(mesh, "_zone_quads"):
+        Xc, Yc, Zc = _display_grids(mesh)
+        ranges = segment_row_ranges(mesh.n_meridional)
+        rgba_lut = np.array([_SEGMENT_RGBA[name]
+                             for name, _, _ in ranges])
+        # Adjacent zones share a boundary row, so the quad rows partition
+        # exactly — zone k owns quad rows [r0, r1).
+        zone_of_qrow = np.empty(Xc.shape[0] - 1, dtype=np.int8)
+        for k, (_, r0, r1) in enumerate(ranges):
+            zone_of_qrow[r0:r1] = k
+        verts = _surface_quads(Xc, Yc, Zc)
+        facecolors = np.tile(rgba_lut[zone_of_qrow], (Xc.shape[1] - 1, 1))
+        n_half_quads = (mesh.n_azimuthal // 2) * (Xc.shape[0] - 1)
+        mesh._zone_quads = (verts, facecolors, n_half_quads)
+    return mesh._zone_quads
 
 
 def _add_cut_face(ax: "Axes3D", mesh: HeadMesh) -> None:
     """Draw the wall cross-section polygon on the y = 0 cut plane.
 
-    The filled profile polygon is drawn at both x > 0 (θ = 0) and
-    x < 0 (θ = π) sides of the cut plane so the full cross-section is
-    visible when the half-section is viewed from any angle.
+    The full cross-section spans both x > 0 (θ = 0) and x < 0 (θ = π)
+    sides of the cut plane so it is visible when the half-section is
+    viewed from any angle. It is traced as ONE closed loop: the profile
+    forward at +x, then mirrored in reverse at −x. The profile starts and
+    ends on the axis (r = 0), so the two halves join seamlessly there —
+    a single polygon, one projection/depth-sort entry instead of two.
 
-    The polygon uses the closed profile arrays from the mesh (``mesh.r``
+    The outline uses the closed profile arrays from the mesh (``mesh.r``
     and ``mesh.z_profile``), which already form a sealed loop.
     """
-    r      = mesh.r
-    z      = mesh.z_profile
-    zeros  = np.zeros_like(r)
-
-    for x_sign in (+1.0, -1.0):
-        verts = np.column_stack([x_sign * r, zeros, z])
-        poly  = Poly3DCollection(
-            [verts],
-            facecolor=CUT_FACE_COLOR,
-            edgecolor=CUT_FACE_EDGE,
-            linewidth=0.4,
-            alpha=0.80,
-            zorder=2,
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+    r = mesh.r
+    z = mesh.z_profile
+    n = r.size
+
+    # One (1, 2N, 3) vertex array → a single polygon in one collection.
+    # zeros() gets the y = 0 cut-plane coordinate for free from the
+    # calloc'd buffer; only x and z need explicit writes — in particular
+    # no zeros_like(r) helper array is ever allocated for the y column.
+    verts = np.zeros((1, 2 * n, 3))
+    verts[0, :n, 0] = r
+    np.negative(r[::-1], out=verts[0, n:, 0])   # mirrored, no `-r` temporary
+    verts[0, :n, 2] = z
+    verts[0, n:, 2] = z[::-1]
+    # Opacity baked into the RGBA colours (alpha=None) — see plot_3d_head.
+    ax.add_collection3d(Poly3DCollection(
+        verts,
+        facecolor=_CUT_FACE_RGBA,
+        edgecolor=_CUT_EDGE_RGBA,
+        linewidth=0.4,
+        zorder=2,
+    ))
+
+
+def _plot_3d_head_pyvista(
+    mesh: HeadMesh,
+    *,
+    half_section: bool,
+    zone_colors: bool,
+    single_color: str,
+) -> "pyvista.Plotter":
+    """VTK-backed variant of plot_3d_head (see the ``backend`` parameter).
+
+    matplotlib's painter-algorithm 3D is CPU-bound Python per redraw; VTK
+    keeps the mesh on the GPU, so rotation stays interactive into the
+    ~1M-quad range. Zone colouring rides a per-cell scalar field instead
+    of per-face RGBA.
+    """
+    if not _HAVE_PYVISTA:
+        raise ImportError("backend='pyvista' requires the optional pyvista package.")
+
+    Xc, Yc, Zc = mesh.closed_grids
+    if half_section:
+        col_end = mesh.n_azimuthal // 2 + 1
+        Xc, Yc, Zc = Xc[:, :col_end], Yc[:, :col_end], Zc[:, :col_end]
+    grid = pyvista.StructuredGrid(Xc, Yc, np.ascontiguousarray(Zc))
+
+    plotter = pyvista.Plotter()
+    if zone_colors:
+        ranges = segment_row_ranges(mesh.n_meridional)
+        zone_of_qrow = np.empty(Xc.shape[0] - 1, dtype=np.int8)
+        for k, (_, r0, r1) in enumerate(ranges):
+            zone_of_qrow[r0:r1] = k
+        # VTK structured cells iterate the first array axis fastest, so the
+        # per-cell field is the row map tiled across azimuthal columns.
+        grid.cell_data["zone"] = np.tile(zone_of_qrow, Xc.shape[1] - 1)
+        plotter.add_mesh(
+            grid,
+            scalars="zone",
+            cmap=list(SEGMENT_COLORS.values()),
+            clim=(-0.5, len(SEGMENT_COLORS) - 0.5),
+            show_scalar_bar=False,
         )
-        ax.add_collection3d(poly)
+    else:
+        plotter.add_mesh(grid, color=single_color)
+    return plotter
 
 
 # ---------------------------------------------------------------------------
@@ -109,7 +307,10 @@ def plot_3d_head(
     azim: float = -45.0,
     zone_colors: bool = True,
     single_color: str = "#4a90d9",
-    stride: int = 1,
+    stride: int | None = 1,
+    antialiased: bool | None = None,
+    rasterized: bool = False,
+    backend: str = "mpl",
 ) -> "Axes3D":
     """Draw the 3D surface of a torospherical head.
 
@@ -135,15 +336,42 @@ def plot_3d_head(
         ``single_color`` — faster and simpler.
     single_color : str
         Hex colour used when ``zone_colors=False``.
-    stride : int
-        Row/column subsampling step for ``plot_surface``.  stride=1 uses
+    stride : int or None
+        Row/column subsampling step for the surface.  stride=1 uses
         every mesh point (highest quality); stride=2 uses every other point
         (renders ~4× faster with minimal visible difference at screen
-        resolution).  Recommended: 1 for export, 2 for interactive use.
+        resolution).  None picks the stride automatically from the axes
+        pixel height — there is no visible benefit to more than about one
+        quad row per rendered pixel row, so dense meshes are coarsened to
+        match the actual display resolution.
+        Recommended: 1 for export, 2 or None for interactive use.
+    antialiased : bool or None
+        Edge antialiasing of the surface polygons.  None (default) means
+        "antialias only at full quality" — True when stride=1, False for
+        strided interactive use, where the extra Agg edge pass is wasted
+        on a deliberately coarsened surface.
+    rasterized : bool
+        Rasterize the surface collection on vector backends.  PDF/SVG
+        exports then embed one raster image of the polygons instead of
+        every outline, keeping file size and viewer load time flat as the
+        mesh densifies; axes, labels and legend stay vectors.  Raster
+        backends (interactive windows, PNG) ignore the flag — each draw
+        still re-renders the collection.  Classic blitting with a cached
+        background does not help here either: every camera move changes
+        the projection of all surface polygons, so there is no static
+        background worth saving.
+    backend : {"mpl", "pyvista"}
+        "pyvista" hands the mesh to VTK/OpenGL (requires the optional
+        pyvista package) and returns a ``pyvista.Plotter`` instead of an
+        Axes3D — worthwhile once matplotlib's CPU-side painter algorithm
+        stops being interactive (roughly 100k+ quads). Only ``ax``,
+        ``half_section``, ``zone_colors`` and ``single_color`` semantics
+        carry over; the remaining styling options are mpl-specific.
 
     Returns
     -------
     ax : Axes3D
+        (or a ``pyvista.Plotter`` when ``backend="pyvista"``)
 
     How zone colouring works
     ------------------------
@@ -153,39 +381,129 @@ def plot_3d_head(
     preserving the seamless join between zones (adjacent zones share a
     boundary row).
     """
+    if backend == "pyvista":
+        return _plot_3d_head_pyvista(
+            mesh,
+            half_section=half_section,
+            zone_colors=zone_colors,
+            single_color=single_color,
+        )
+    if backend != "mpl":
+        raise ValueError(f"backend must be 'mpl' or 'pyvista', got {backend!r}")
+
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
     if ax is None:
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(9, 8))
         ax  = fig.add_subplot(111, projection="3d")
 
+    if stride is None:
+        # Auto LOD: cap the drawn resolution at ~1 quad row per pixel row
+        # of the axes — anything finer is invisible at this display size.
+        pixel_rows = max(int(ax.bbox.height), 1)
+        stride = max(1, mesh.X.shape[0] // pixel_rows)
+
+    if antialiased is None:
+        antialiased = stride == 1
+
+    # Bind the mesh attributes the draw path needs to locals up front —
+    # the hot sections below then run on LOAD_FAST instead of repeated
+    # attribute lookups through the dataclass.
+    n_azimuthal  = mesh.n_azimuthal
+    n_meridional = mesh.n_meridional
+
     # Azimuthal column range:
-    #   full view  → all columns  (θ: 0 → 2π)
-    #   half view  → first half   (θ: 0 → π)
-    n_half  = mesh.n_azimuthal // 2
-    col_end = n_half + 1 if half_section else mesh.n_azimuthal + 1
+    #   full view  → closed grids with the seam column  (θ: 0 → 2π)
+    #   half view  → first half of the open grids       (θ: 0 → π)
+    # The column slice is taken (and made contiguous) ONCE here rather than
+    # per zone: every zone slice below is then a cheap contiguous row-range
+    # view, and on half-section the draw path touches half the bytes.
+    # Grids come from the cached float32 display copies — see _display_grids.
+    Xf, Yf, Zf = _display_grids(mesh)
+    if half_section:
+        col_end = n_azimuthal // 2 + 1
+        Xc = np.ascontiguousarray(Xf[:, :col_end])
+        Yc = np.ascontiguousarray(Yf[:, :col_end])
+        Zc = np.ascontiguousarray(Zf[:, :col_end])
+    else:
+        Xc, Yc, Zc = Xf, Yf, Zf
 
     if zone_colors:
-        # Draw each zone as its own surface patch in a distinct colour
-        for name, r0, r1 in segment_row_ranges(mesh.n_meridional):
-            ax.plot_surface(
-                mesh.X[r0:r1 + 1, :col_end],
-                mesh.Y[r0:r1 + 1, :col_end],
-                mesh.Z[r0:r1 + 1, :col_end],
-                color=SEGMENT_COLORS[name],
-                alpha=alpha,
+        # One Poly3DCollection for all 8 zones: the quad vertex arrays are
+        # gathered vectorized per zone, concatenated, and projected in a
+        # single pass — instead of 8 plot_surface calls that each build
+        # per-quad Python lists and depth-sort independently.
+        if stride == 1:
+            # Fast path: the full-revolution quad/colour arrays are built
+            # once per mesh (see _zone_quad_arrays); the half view is a
+            # prefix slice of the same buffers.
+            verts, facecolors, n_half_quads = _zone_quad_arrays(mesh)
+            if half_section:
+                verts = verts[:n_half_quads]
+                facecolors = facecolors[:n_half_quads]
+        else:
+            # Strided LOD: subsample per zone so every zone boundary row
+            # is kept and colours never bleed across a coarsened quad.
+            # segment_row_ranges is lru_cached at its definition in
+            # mesh_3d, so repeated draws hit the memo, not the index math.
+            ranges = segment_row_ranges(n_meridional)
+            rgba_lut = np.array([_SEGMENT_RGBA[name]
+                                 for name, _, _ in ranges])
+            cols = _lod_indices(Xc.shape[1], stride)
+            verts_parts, color_parts = [], []
+            for k, (_, r0, r1) in enumerate(ranges):
+                rows = r0 + _lod_indices(r1 + 1 - r0, stride)
+                ij = np.ix_(rows, cols)
+                v = _surface_quads(Xc[ij], Yc[ij], Zc[ij])
+                verts_parts.append(v)
+                color_parts.append(np.tile(rgba_lut[k], (v.shape[0], 1)))
+            verts = np.concatenate(verts_parts)
+            facecolors = np.concatenate(color_parts)
+        # Bake the opacity into the RGBA array rather than setting the
+        # collection-level alpha: with alpha left at None matplotlib treats
+        # the colours as final and skips its alpha restacking pass on
+        # every projection.
+        if alpha != 1.0:
+            facecolors = facecolors.copy()
+            facecolors[:, 3] *= alpha
+        # Reuse the collection on redraws into the same axes: geometry is
+        # static (only the camera moves), so when the mesh digest and draw
+        # options match, updating the cached artist's vertices skips the
+        # whole construct/add/autoscale pass.
+        key = (mesh.digest, half_section, stride, alpha,
+               antialiased, rasterized)
+        cached = getattr(ax, "_zone_poly", None)
+        if cached is not None and cached[0] == key \
+                and cached[1] in ax.collections:
+            cached[1].set_verts(verts)
+        else:
+            had_data = ax.has_data()
+            # verts stays one homogeneous (N, 4, 3) ndarray — set_verts
+            # has a fast path for uniform-length polygon arrays that skips
+            # the per-polygon float-conversion walk a ragged list would
+            # trigger.
+            poly = Poly3DCollection(
+                verts,
+                facecolors=facecolors,
                 linewidth=0,
-                antialiased=True,
-                rstride=stride, cstride=stride,
+                antialiased=antialiased,
+                rasterized=rasterized,
             )
+            ax.add_collection3d(poly)
+            # add_collection3d does not autoscale like plot_surface does
+            ax.auto_scale_xyz(Xc, Yc, Zc, had_data)
+            ax._zone_poly = (key, poly)
     else:
         # Single-colour surface — one plot_surface call, maximum performance
+        # (alpha baked into the RGBA here too, see the zone branch)
         ax.plot_surface(
-            mesh.X[:, :col_end],
-            mesh.Y[:, :col_end],
-            mesh.Z[:, :col_end],
-            color=single_color,
-            alpha=alpha,
+            Xc, Yc, Zc,
+            color=to_rgba(single_color, alpha),
             linewidth=0,
-            antialiased=True,
+            antialiased=antialiased,
+            rasterized=rasterized,
             rstride=stride, cstride=stride,
         )
 
@@ -229,7 +547,13 @@ def plot_head_comparison(
     -------
     fig : matplotlib Figure
     """
-    fig = plt.figure(figsize=(16, 8))
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Patch
+
+    # constrained_layout solves panel placement geometrically during the
+    # draw; tight_layout would instead re-measure every artist bbox, which
+    # for 3D axes means projecting all vertices once more at the end.
+    fig = plt.figure(figsize=(16, 8), constrained_layout=True)
 
     # ── Left panel: full 360° view ────────────────────────────────────────
     ax_full = fig.add_subplot(121, projection="3d")
@@ -273,8 +597,6 @@ def plot_head_comparison(
         f"D = {g.D:.0f} mm    $R_c$ = {g.R_c:.0f} mm    "
         f"$r_k$ = {g.r_k:.0f} mm    t = {g.t:.0f} mm    h = {g.h:.0f} mm",
         fontsize=12,
-        y=1.02,
     )
 
-    plt.tight_layout()
     return fig